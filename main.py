@@ -6,9 +6,9 @@ from collections.abc import Sequence
 
 from mellea.core.backend import Backend
 from mellea.core.base import CBlock, Component, Context, ModelOutputThunk
-from mellea.core.requirement import Requirement, ValidationResult
+from mellea.core.requirement import ValidationResult
 
-from rhizome import Agent, Rhizome, RhizomeConfig
+from rhizome import Agent, Rhizome, RhizomeConfig, StateRequirement
 from rhizome.compost import CompostEntry
 
 
@@ -85,7 +85,11 @@ async def main() -> None:
         r.register(
             Agent(
                 name="echo",
-                needs=(Requirement(validation_fn=has_human_input),),
+                needs=(
+                    StateRequirement(
+                        validation_fn=has_human_input, deps=("humanity",)
+                    ),
+                ),
                 fun=echo_agent,
                 abilities=(),
             )
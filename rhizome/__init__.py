@@ -1,4 +1,4 @@
-from rhizome.agent import Agent, AgentHandle, AgentStatus
+from rhizome.agent import Agent, AgentHandle, AgentStatus, StateRequirement
 from rhizome.beat import BeatRecord, run_beat
 from rhizome.compost import CompostEntry, CompostPile
 from rhizome.context_views import GardenerView, GlobalRhizomeView, RhizomeAgentAnthology
@@ -22,5 +22,6 @@ __all__ = [
     "Rhizome",
     "RhizomeAgentAnthology",
     "RhizomeConfig",
+    "StateRequirement",
     "run_beat",
 ]
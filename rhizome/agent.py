@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import enum
-import uuid
+import itertools
+import os
+import traceback
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
@@ -20,6 +22,16 @@ class MelleaProgram(Protocol):
     ) -> None: ...
 
 
+# Handle ids end up in persisted compost keys, so a per-process random prefix
+# keeps them distinct across restarts while the counter stays syscall-free.
+_HANDLE_ID_PREFIX = os.urandom(4).hex()
+_handle_counter = itertools.count()
+
+
+def _next_handle_id() -> str:
+    return f"{_HANDLE_ID_PREFIX}{next(_handle_counter):04x}"
+
+
 class AgentStatus(enum.Enum):
     DORMANT = "dormant"
     PENDING = "pending"
@@ -29,6 +41,43 @@ class AgentStatus(enum.Enum):
     KILLED = "killed"
 
 
+_VALID_TRANSITIONS: dict[AgentStatus, frozenset[AgentStatus]] = {
+    AgentStatus.DORMANT: frozenset((AgentStatus.PENDING, AgentStatus.KILLED)),
+    AgentStatus.PENDING: frozenset((AgentStatus.RUNNING, AgentStatus.KILLED)),
+    AgentStatus.RUNNING: frozenset(
+        (AgentStatus.COMPLETED, AgentStatus.FAILED, AgentStatus.KILLED)
+    ),
+}
+
+
+class StateRequirement(Requirement):
+    """A Requirement whose outcome depends only on the named slices of state.
+
+    ``deps`` lists what the check reads, from ``STATE_DEPS``. The gardener
+    reuses the previous result across beats until one of them changes, so
+    the check must be a pure function of that state.
+    """
+
+    STATE_DEPS = ("agents", "compost", "environment", "humanity")
+
+    def __init__(
+        self,
+        description: str | None = None,
+        validation_fn: Any = None,
+        *,
+        deps: tuple[str, ...],
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(description, validation_fn, **kwargs)
+        unknown = set(deps) - set(self.STATE_DEPS)
+        if unknown:
+            raise ValueError(
+                f"Unknown requirement deps {sorted(unknown)}; "
+                f"expected any of {self.STATE_DEPS}"
+            )
+        self.deps = tuple(deps)
+
+
 @dataclass(frozen=True)
 class Agent:
     name: str
@@ -38,18 +87,26 @@ class Agent:
     background: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentHandle:
     agent: Agent
     status: AgentStatus = AgentStatus.DORMANT
-    handle_id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    handle_id: str = field(default_factory=_next_handle_id)
     error: BaseException | None = field(default=None, repr=False)
     _task: Any = field(default=None, repr=False)  # asyncio.Task when RUNNING
+    _rhizome: Rhizome | None = field(default=None, repr=False, compare=False)
 
     @property
     def name(self) -> str:
         return self.agent.name
 
+    @property
+    def error_traceback(self) -> str | None:
+        """Full formatted traceback of ``error``, built on demand."""
+        if self.error is None:
+            return None
+        return "".join(traceback.format_exception(self.error))
+
     @property
     def is_terminal(self) -> bool:
         return self.status in (
@@ -59,19 +116,12 @@ class AgentHandle:
         )
 
     def transition(self, new_status: AgentStatus) -> None:
-        _VALID_TRANSITIONS = {
-            AgentStatus.DORMANT: (AgentStatus.PENDING, AgentStatus.KILLED),
-            AgentStatus.PENDING: (AgentStatus.RUNNING, AgentStatus.KILLED),
-            AgentStatus.RUNNING: (
-                AgentStatus.COMPLETED,
-                AgentStatus.FAILED,
-                AgentStatus.KILLED,
-            ),
-        }
-        allowed = _VALID_TRANSITIONS.get(self.status, ())
+        allowed = _VALID_TRANSITIONS.get(self.status, frozenset())
         if new_status not in allowed:
             raise ValueError(
                 f"Invalid transition: {self.status.value} → {new_status.value} "
                 f"for agent '{self.name}'"
             )
-        self.status = new_status
+        old_status, self.status = self.status, new_status
+        if self._rhizome is not None:
+            self._rhizome._on_transition(self, old_status)
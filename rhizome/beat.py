@@ -6,16 +6,18 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
+from mellea.core.requirement import ValidationResult
+
 from rhizome.agent import AgentHandle, AgentStatus
-from rhizome.compost import CompostEntry
-from rhizome.context_views import GlobalRhizomeView
+from rhizome.compost import CompostEntry, beat_clock
+from rhizome.context_views import GardenerView, GlobalRhizomeView
 from rhizome.gardener import Gardener
 
 if TYPE_CHECKING:
     from rhizome.rhizome import Rhizome
 
 
-@dataclass
+@dataclass(slots=True)
 class BeatRecord:
     beat_number: int
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
@@ -34,37 +36,52 @@ async def run_beat(
 ) -> BeatRecord:
     """Execute one beat of the rhizome. Implements the 6-phase algorithm."""
     record = BeatRecord(beat_number=rhizome.beat_count)
-    gardener = Gardener(rhizome.backend)
-    has_new_human_input = rhizome.has_unprocessed_human_input()
+    # Compost written during the beat (agents included) is stamped with the
+    # beat's start time.
+    token = beat_clock.set(record.timestamp)
+    try:
+        return await _run_phases(rhizome, record, concurrency)
+    finally:
+        beat_clock.reset(token)
+
+
+async def _run_phases(
+    rhizome: Rhizome, record: BeatRecord, concurrency: int
+) -> BeatRecord:
+    """Run the six phases of one beat, filling in ``record``."""
+    gardener = Gardener(rhizome.backend, concurrency=concurrency)
 
     # ── Phase 1: Interrupt ──
-    if has_new_human_input:
-        for handle in rhizome.handles:
-            if handle.status in (AgentStatus.RUNNING, AgentStatus.PENDING):
-                if not handle.agent.background:
-                    handle.transition(AgentStatus.KILLED)
-                    record.killed.append(handle.name)
-                    await rhizome.compost.add(
-                        CompostEntry(
-                            key=f"beat:{record.beat_number}:killed:{handle.handle_id}",
-                            content=f"Agent '{handle.name}' killed by human interrupt",
-                            author="beat",
-                        )
+    # Skip the handle scan entirely when nothing is there to kill
+    if rhizome.has_unprocessed_human_input() and rhizome.has_interruptible_handles():
+        for handle in rhizome.handles_with_status(
+            AgentStatus.RUNNING, AgentStatus.PENDING
+        ):
+            if not handle.agent.background:
+                handle.transition(AgentStatus.KILLED)
+                record.killed.append(handle.name)
+                await rhizome.compost.add(
+                    CompostEntry(
+                        key=f"beat:{record.beat_number}:killed:{handle.handle_id}",
+                        content=f"Agent '{handle.name}' killed by human interrupt",
+                        author="beat",
                     )
+                )
+                if not rhizome.has_interruptible_handles():
+                    break
 
     rhizome.mark_human_input_processed()
 
     # ── Phase 2: Background agents ──
     background_handles = [
         h
-        for h in rhizome.handles
-        if h.agent.background and h.status == AgentStatus.DORMANT
+        for h in rhizome.handles_with_status(AgentStatus.DORMANT)
+        if h.agent.background
     ]
     for handle in background_handles:
         handle.transition(AgentStatus.PENDING)
 
-    for handle in background_handles:
-        await _run_agent(rhizome, handle, record)
+    await _run_agents(rhizome, background_handles, record, concurrency)
 
     # ── Phase 3: Gardener evaluation ──
     activated = await gardener.evaluate(rhizome)
@@ -72,80 +89,113 @@ async def run_beat(
         record.activated.append(handle.name)
 
     # ── Phase 4: Concurrent execution ──
-    pending = [h for h in rhizome.handles if h.status == AgentStatus.PENDING]
-    if pending:
-        sem = asyncio.Semaphore(concurrency)
-
-        async def run_bounded(h: AgentHandle) -> None:
-            async with sem:
-                await _run_agent(rhizome, h, record)
-
-        await asyncio.gather(*(run_bounded(h) for h in pending))
+    pending = rhizome.handles_with_status(AgentStatus.PENDING)
+    await _run_agents(rhizome, pending, record, concurrency)
 
     # ── Phase 5: Postcondition assertion ──
-    completed_handles = [
-        h for h in rhizome.handles if h.status == AgentStatus.COMPLETED
-    ]
-    for handle in completed_handles:
-        if handle.agent.abilities:
-            from rhizome.context_views import GardenerView
-
-            post_view = GardenerView.from_rhizome(rhizome)
-            for req in handle.agent.abilities:
-                try:
+    post_view: GardenerView | None = None
+    post_results: dict[int, ValidationResult] = {}
+    for handle in rhizome.handles_with_status(AgentStatus.COMPLETED):
+        for req in handle.agent.abilities:
+            try:
+                result = post_results.get(id(req))
+                if result is None:
+                    if post_view is None:
+                        post_view = GardenerView.from_rhizome(rhizome)
                     result = await req.validate(rhizome.backend, post_view)
-                    if not result:
-                        warning = (
-                            f"Postcondition not met for '{handle.name}': "
-                            f"{req.description or 'unnamed requirement'}"
-                        )
-                        record.postcondition_warnings.append(warning)
-                        await rhizome.compost.add(
-                            CompostEntry(
-                                key=f"beat:{record.beat_number}:postcondition_warning:{handle.handle_id}",
-                                content=warning,
-                                author="beat",
-                            )
-                        )
-                except Exception:
+                    post_results[id(req)] = result
+                if not result:
                     warning = (
-                        f"Postcondition check failed for '{handle.name}': "
-                        f"{traceback.format_exc()}"
+                        f"Postcondition not met for '{handle.name}': "
+                        f"{req.description or 'unnamed requirement'}"
                     )
                     record.postcondition_warnings.append(warning)
+                    await rhizome.compost.add(
+                        CompostEntry(
+                            key=f"beat:{record.beat_number}:postcondition_warning:{handle.handle_id}",
+                            content=warning,
+                            author="beat",
+                        )
+                    )
+            except Exception:
+                warning = (
+                    f"Postcondition check failed for '{handle.name}': "
+                    f"{traceback.format_exc()}"
+                )
+                record.postcondition_warnings.append(warning)
 
     # ── Phase 6: Persist ──
-    summary_lines = [f"Beat {record.beat_number} summary:"]
-    if record.killed:
-        summary_lines.append(f"  Killed: {', '.join(record.killed)}")
-    if record.activated:
-        summary_lines.append(f"  Activated: {', '.join(record.activated)}")
-    if record.completed:
-        summary_lines.append(f"  Completed: {', '.join(record.completed)}")
-    if record.failed:
-        summary_lines.append(f"  Failed: {', '.join(record.failed)}")
-    if record.postcondition_warnings:
-        summary_lines.append(
-            f"  Postcondition warnings: {len(record.postcondition_warnings)}"
-        )
+    quiescent = not (
+        record.killed
+        or record.activated
+        or record.completed
+        or record.failed
+        or record.postcondition_warnings
+    )
+    if not quiescent:
+        summary_lines = [f"Beat {record.beat_number} summary:"]
+        if record.killed:
+            summary_lines.append(f"  Killed: {', '.join(record.killed)}")
+        if record.activated:
+            summary_lines.append(f"  Activated: {', '.join(record.activated)}")
+        if record.completed:
+            summary_lines.append(f"  Completed: {', '.join(record.completed)}")
+        if record.failed:
+            summary_lines.append(f"  Failed: {', '.join(record.failed)}")
+        if record.postcondition_warnings:
+            summary_lines.append(
+                f"  Postcondition warnings: {len(record.postcondition_warnings)}"
+            )
 
-    await rhizome.compost.add(
-        CompostEntry(
-            key=f"beat:{record.beat_number}:summary",
-            content="\n".join(summary_lines),
-            author="beat",
+        await rhizome.compost.add(
+            CompostEntry(
+                key=f"beat:{record.beat_number}:summary",
+                content="\n".join(summary_lines),
+                author="beat",
+            )
         )
-    )
 
-    await rhizome.compost.save(rhizome.environment.compost_path)
-    record.commit_sha = rhizome.environment.commit(
-        f"beat {record.beat_number}"
-    )
+    # A quiescent beat has nothing to record unless compost or environment
+    # files were written from outside the beat since the last commit.
+    if (
+        not quiescent
+        or rhizome.compost.has_unsaved_changes
+        or rhizome.environment.has_uncommitted_changes
+    ):
+        await rhizome.compost.save(rhizome.environment.compost_path)
+        record.commit_sha = rhizome.environment.commit(
+            f"beat {record.beat_number}"
+        )
 
     rhizome.beat_count += 1
     return record
 
 
+async def _run_agents(
+    rhizome: Rhizome,
+    handles: list[AgentHandle],
+    record: BeatRecord,
+    concurrency: int,
+) -> None:
+    """Run PENDING handles concurrently on at most ``concurrency`` workers."""
+    if not handles:
+        return
+    # Fixed pool of workers draining a queue, so only `concurrency`
+    # coroutines exist however many agents are pending.
+    queue: asyncio.Queue[AgentHandle | None] = asyncio.Queue()
+    workers = min(concurrency, len(handles))
+    for h in handles:
+        queue.put_nowait(h)
+    for _ in range(workers):
+        queue.put_nowait(None)  # one stop sentinel per worker
+
+    async def worker() -> None:
+        while (h := await queue.get()) is not None:
+            await _run_agent(rhizome, h, record)
+
+    await asyncio.gather(*(worker() for _ in range(workers)))
+
+
 async def _run_agent(
     rhizome: Rhizome, handle: AgentHandle, record: BeatRecord
 ) -> None:
@@ -163,7 +213,11 @@ async def _run_agent(
         await rhizome.compost.add(
             CompostEntry(
                 key=f"agent:{handle.handle_id}:error",
-                content=f"Agent '{handle.name}' failed: {exc}\n{traceback.format_exc()}",
+                content=(
+                    f"Agent '{handle.name}' failed: {exc!r}\n"
+                    # Innermost frames only; handle.error_traceback has the rest
+                    + "".join(traceback.format_tb(exc.__traceback__, limit=-5))
+                ),
                 author=handle.name,
             )
         )
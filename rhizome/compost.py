@@ -2,17 +2,29 @@ from __future__ import annotations
 
 import asyncio
 import json
-from dataclasses import dataclass, field
+import os
+from collections.abc import Iterable
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 
+# Set by run_beat for its duration so everything a beat writes shares one
+# timestamp instead of reading the clock per entry.
+beat_clock: ContextVar[datetime | None] = ContextVar("beat_clock", default=None)
 
-@dataclass
+
+def _now() -> datetime:
+    return beat_clock.get() or datetime.now(timezone.utc)
+
+
+@dataclass(slots=True, eq=False)
 class CompostEntry:
     key: str
     content: str
     author: str
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = field(default_factory=_now)
     supersedes: str | None = None
     _stale: bool = field(default=False, repr=False)
 
@@ -38,72 +50,203 @@ class CompostEntry:
         entry._stale = d.get("_stale", False)
         return entry
 
+    def to_jsonl(self) -> bytes:
+        return json.dumps(self.to_dict(), separators=(",", ":")).encode() + b"\n"
+
 
 class CompostPile:
+    """Append-mostly store of compost entries.
+
+    Entries are kept in chronological order: re-adding or updating a key
+    moves it to the end. Persisted as a JSONL log: each save appends one
+    line per entry touched since the previous save, and the last line for a
+    key wins on load. The log is compacted to one line per entry once it
+    grows past ``COMPACT_RATIO`` times the number of entries.
+
+    Entries are copy-on-write: once added, an entry object is never mutated
+    by the pile. Updates and staling swap in a new ``CompostEntry`` under the
+    lock, so readers need no lock and a list returned by ``query()`` stays a
+    consistent snapshot of the ``version`` it was taken at.
+    """
+
+    COMPACT_RATIO = 4
+
     def __init__(self) -> None:
-        self._entries: dict[str, CompostEntry] = {}
+        self._entries: dict[str, CompostEntry] = {}  # every entry, stale included
+        self._active: dict[str, CompostEntry] = {}  # live subset, same order
+        self._by_author: dict[str, dict[str, CompostEntry]] = {}
         self._lock = asyncio.Lock()
+        self._version: int = 0  # bumped on every mutation
+        self._dirty: dict[str, CompostEntry] = {}
+        self._log_path: Path | None = None  # log file this pile is in sync with
+        self._log_lines: int = 0
+        self._legacy_path: Path | None = None  # pre-JSONL file to drop once compacted
 
     async def add(self, entry: CompostEntry) -> None:
         async with self._lock:
             if entry.supersedes and entry.supersedes in self._entries:
-                self._entries[entry.supersedes]._stale = True
-            self._entries[entry.key] = entry
+                superseded = self._mark_stale(self._entries[entry.supersedes])
+                self._dirty[superseded.key] = superseded
+            self._insert(entry)
+            # Re-queue at the end so the appended lines replay in pile order
+            self._dirty.pop(entry.key, None)
+            self._dirty[entry.key] = entry
+            self._version += 1
 
     async def update(self, key: str, content: str) -> None:
         async with self._lock:
             if key not in self._entries:
                 raise KeyError(f"No compost entry with key '{key}'")
-            self._entries[key].content = content
-            self._entries[key].timestamp = datetime.now(timezone.utc)
+            entry = replace(
+                self._entries[key],
+                content=content,
+                timestamp=_now(),
+            )
+            self._insert(entry)
+            self._dirty.pop(key, None)
+            self._dirty[key] = entry
+            self._version += 1
 
     async def remove(self, key: str) -> None:
         async with self._lock:
             if key in self._entries:
-                self._entries[key]._stale = True
+                self._dirty[key] = self._mark_stale(self._entries[key])
+                self._version += 1
+
+    def _insert(self, entry: CompostEntry) -> None:
+        """Place ``entry`` at the chronological end, replacing any entry with its key."""
+        old = self._entries.pop(entry.key, None)
+        if old is not None:
+            del self._by_author[old.author][old.key]
+        self._entries[entry.key] = entry
+        self._by_author.setdefault(entry.author, {})[entry.key] = entry
+        self._active.pop(entry.key, None)
+        if not entry._stale:
+            self._active[entry.key] = entry
+
+    def _mark_stale(self, entry: CompostEntry) -> CompostEntry:
+        """Swap in a stale copy of ``entry``, keeping its place; returns the copy."""
+        stale = replace(entry, _stale=True)
+        self._entries[entry.key] = stale
+        self._by_author[entry.author][entry.key] = stale
+        self._active.pop(entry.key, None)
+        return stale
+
+    @property
+    def version(self) -> int:
+        """Mutation counter; unchanged version means unchanged contents."""
+        return self._version
+
+    @property
+    def has_unsaved_changes(self) -> bool:
+        return bool(self._dirty)
 
     def get(self, key: str) -> CompostEntry | None:
-        entry = self._entries.get(key)
-        if entry and not entry._stale:
-            return entry
-        return None
+        return self._active.get(key)
 
     def query(self, *, author: str | None = None, include_stale: bool = False) -> list[CompostEntry]:
-        results = []
-        for entry in self._entries.values():
-            if not include_stale and entry._stale:
-                continue
-            if author and entry.author != author:
-                continue
-            results.append(entry)
-        return sorted(results, key=lambda e: e.timestamp)
+        if author:
+            entries = self._by_author.get(author, {}).values()
+            if include_stale:
+                return list(entries)
+            return [e for e in entries if not e._stale]
+        if include_stale:
+            return list(self._entries.values())
+        return list(self._active.values())
 
     def active_entries(self) -> list[CompostEntry]:
         return self.query(include_stale=False)
 
+    def recent(self, n: int) -> list[CompostEntry]:
+        """The last ``n`` active entries, oldest first, without copying the rest."""
+        return list(islice(reversed(self._active.values()), n))[::-1]
+
     def all_entries(self) -> list[CompostEntry]:
         return self.query(include_stale=True)
 
-    def to_json(self) -> str:
-        return json.dumps(
-            [e.to_dict() for e in self._entries.values()],
-            indent=2,
-        )
+    def to_jsonl(self) -> bytes:
+        return b"".join(e.to_jsonl() for e in self._entries.values())
 
     @classmethod
-    def from_json(cls, data: str) -> CompostPile:
+    def from_jsonl(cls, lines: Iterable[bytes]) -> CompostPile:
         pile = cls()
-        for d in json.loads(data):
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                d = json.loads(line)
+            except ValueError:  # includes UnicodeDecodeError from a torn multibyte char
+                if not line.endswith(b"\n"):
+                    break  # torn final append from an interrupted save
+                raise
             entry = CompostEntry.from_dict(d)
-            pile._entries[entry.key] = entry
+            prev = pile._entries.get(entry.key)
+            if (
+                prev is not None
+                and entry._stale
+                and {**prev.to_dict(), "_stale": True} == entry.to_dict()
+            ):
+                # Only the stale flag changed, so the entry keeps its place
+                pile._mark_stale(prev)
+            else:
+                pile._insert(entry)
+            pile._log_lines += 1
         return pile
 
     async def save(self, path: Path) -> None:
+        """Append entries changed since the last save to the log at ``path``."""
+        if (
+            path != self._log_path
+            or self._log_lines + len(self._dirty)
+            > self.COMPACT_RATIO * max(len(self._entries), 1)
+        ):
+            self._compact(path)
+            return
+        if not self._dirty:
+            return
+        data = b"".join(e.to_jsonl() for e in self._dirty.values())
+        with open(path, "ab") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self._log_lines += len(self._dirty)
+        self._dirty.clear()
+
+    def _compact(self, path: Path) -> None:
+        """Rewrite the log at ``path`` with exactly one line per entry."""
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(self.to_json())
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(self.to_jsonl())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        if self._legacy_path is not None:
+            self._legacy_path.unlink(missing_ok=True)
+            self._legacy_path = None
+        self._log_path = path
+        self._log_lines = len(self._entries)
+        self._dirty.clear()
 
     @classmethod
     async def load(cls, path: Path) -> CompostPile:
         if path.exists():
-            return cls.from_json(path.read_text())
+            data = path.read_bytes()
+            pile = cls.from_jsonl(data.splitlines(keepends=True))
+            if data.endswith(b"\n") or not data:
+                # A torn tail is left unsynced so the first save rewrites the log
+                pile._log_path = path
+            return pile
+        legacy = path.with_suffix(".json")
+        if legacy.exists():
+            # A pile saved before the JSONL log existed is one JSON array that
+            # kept each key at its first position, so chronological order is
+            # restored from timestamps. The pile is left unsynced so the first
+            # save compacts it into the log.
+            pile = cls()
+            entries = map(CompostEntry.from_dict, json.loads(legacy.read_text()))
+            for entry in sorted(entries, key=lambda e: e.timestamp):
+                pile._insert(entry)
+            pile._legacy_path = legacy
+            return pile
         return cls()
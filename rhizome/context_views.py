@@ -1,55 +1,75 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from abc import abstractmethod
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Self
 
 from mellea.core.base import CBlock, Component, Context, ModelOutputThunk
 
 if TYPE_CHECKING:
+    from rhizome.compost import CompostEntry
     from rhizome.rhizome import Rhizome
 
 
-class GlobalRhizomeView(Context):
-    """High-level summary view: active agents, recent compost, environment status.
+class _RhizomeView(Context):
+    """Shared plumbing for the read-only views built from a Rhizome."""
 
-    Used as context for agent programs that need situational awareness.
-    """
+    def add(self, c: Component | CBlock) -> Self:
+        return type(self).from_previous(self, c)
 
-    def __init__(self) -> None:
-        super().__init__()
+    def extend(self, cs: Iterable[Component | CBlock]) -> Self:
+        """Append ``cs`` in order.
 
-    def add(self, c: Component | CBlock) -> GlobalRhizomeView:
-        new = GlobalRhizomeView.from_previous(self, c)
+        Shorthand for chaining ``add``: it links one new context node per
+        item, exactly as the equivalent ``add`` calls would.
+        """
+        new = self
+        for c in cs:
+            new = new.add(c)
         return new
 
     def view_for_generation(self) -> list[Component | CBlock] | None:
         return self.as_list()
 
     @classmethod
-    def from_rhizome(cls, rhizome: Rhizome) -> GlobalRhizomeView:
-        ctx = cls()
+    def from_rhizome(cls, rhizome: Rhizome) -> Self:
+        return rhizome._cached_view(cls, cls._build)
+
+    @classmethod
+    @abstractmethod
+    def _build(cls, rhizome: Rhizome) -> Self: ...
+
+
+class GlobalRhizomeView(_RhizomeView):
+    """High-level summary view: active agents, recent compost, environment status.
+
+    Used as context for agent programs that need situational awareness.
+    """
+
+    @classmethod
+    def _build(cls, rhizome: Rhizome) -> GlobalRhizomeView:
+        blocks: list[CBlock] = []
 
         # Active agents summary
         from rhizome.agent import AgentStatus
 
-        agents = rhizome.handles
-        active = [h for h in agents if not h.is_terminal]
-        dormant = [h for h in agents if h.status == AgentStatus.DORMANT]
-        running = [h for h in agents if h.status == AgentStatus.RUNNING]
+        dormant = rhizome.count_with_status(AgentStatus.DORMANT)
+        running = rhizome.count_with_status(AgentStatus.RUNNING)
+        active = dormant + running + rhizome.count_with_status(AgentStatus.PENDING)
 
         agent_summary = (
-            f"Agents: {len(agents)} total, {len(active)} active, "
-            f"{len(dormant)} dormant, {len(running)} running"
+            f"Agents: {len(rhizome.handles)} total, {active} active, "
+            f"{dormant} dormant, {running} running"
         )
-        ctx = ctx.add(CBlock(agent_summary))
+        blocks.append(CBlock(agent_summary))
 
         # Recent compost entries
-        entries = rhizome.compost.active_entries()
-        if entries:
-            recent = entries[-10:]  # last 10
+        recent = rhizome.compost.recent(10)
+        if recent:
             compost_lines = ["Recent compost entries:"]
             for e in recent:
                 compost_lines.append(f"  [{e.author}] {e.key}: {e.content[:200]}")
-            ctx = ctx.add(CBlock("\n".join(compost_lines)))
+            blocks.append(CBlock("\n".join(compost_lines)))
 
         # Humanity list
         if rhizome.humanity:
@@ -57,73 +77,63 @@ class GlobalRhizomeView(Context):
             human_lines = ["Recent human inputs:"]
             for h in recent_human:
                 human_lines.append(f"  [{h.timestamp.isoformat()}] {h.content}")
-            ctx = ctx.add(CBlock("\n".join(human_lines)))
+            blocks.append(CBlock("\n".join(human_lines)))
 
         # Environment status
         try:
             files = rhizome.environment.list_files()
-            ctx = ctx.add(CBlock(f"Environment: {len(files)} tracked files"))
+            blocks.append(CBlock(f"Environment: {len(files)} tracked files"))
         except Exception:
-            ctx = ctx.add(CBlock("Environment: not initialized"))
+            blocks.append(CBlock("Environment: not initialized"))
 
-        return ctx
+        return cls().extend(blocks)
 
 
-class RhizomeAgentAnthology(Context):
+class RhizomeAgentAnthology(_RhizomeView):
     """History of agent activity: completed runs, summaries, event order.
 
-    Used for agents that need to understand the project's history.
+    Used for agents that need to understand the project's history. The
+    history is rendered as a single CBlock; ``entries`` keeps the underlying
+    compost entries for callers that need them one at a time.
     """
 
     def __init__(self) -> None:
         super().__init__()
+        self.entries: tuple[CompostEntry, ...] = ()
 
     def add(self, c: Component | CBlock) -> RhizomeAgentAnthology:
-        new = RhizomeAgentAnthology.from_previous(self, c)
+        new = super().add(c)
+        new.entries = self.entries
         return new
 
-    def view_for_generation(self) -> list[Component | CBlock] | None:
-        return self.as_list()
-
     @classmethod
-    def from_rhizome(cls, rhizome: Rhizome) -> RhizomeAgentAnthology:
+    def _build(cls, rhizome: Rhizome) -> RhizomeAgentAnthology:
         ctx = cls()
 
         # All compost entries in chronological order — this IS the history
         entries = rhizome.compost.all_entries()
-        for entry in entries:
-            stale_marker = " [superseded]" if entry._stale else ""
-            ctx = ctx.add(
-                CBlock(
-                    f"[{entry.timestamp.isoformat()}] {entry.author} → {entry.key}{stale_marker}\n"
-                    f"{entry.content}"
-                )
+        ctx.entries = tuple(entries)
+        if entries:
+            history = "\n\n".join(
+                f"[{entry.timestamp.isoformat()}] {entry.author} → {entry.key}"
+                f"{' [superseded]' if entry._stale else ''}\n"
+                f"{entry.content}"
+                for entry in entries
             )
+            ctx = ctx.add(CBlock(history))
 
         return ctx
 
 
-class GardenerView(Context):
+class GardenerView(_RhizomeView):
     """Synthetic context for Requirement.validate() during gardener evaluation.
 
     Contains current rhizome state as CBlocks, with a synthetic ModelOutputThunk
     as the last element so LLM-as-judge requirements can evaluate against it.
     """
 
-    def __init__(self) -> None:
-        super().__init__()
-
-    def add(self, c: Component | CBlock) -> GardenerView:
-        new = GardenerView.from_previous(self, c)
-        return new
-
-    def view_for_generation(self) -> list[Component | CBlock] | None:
-        return self.as_list()
-
     @classmethod
-    def from_rhizome(cls, rhizome: Rhizome) -> GardenerView:
-        ctx = cls()
-
+    def _build(cls, rhizome: Rhizome) -> GardenerView:
         # Build a text representation of current state
         state_parts = []
 
@@ -159,13 +169,10 @@ class GardenerView(Context):
 
         state_text = "\n".join(state_parts) if state_parts else "(empty rhizome)"
 
-        # Add the state as a CBlock
-        ctx = ctx.add(CBlock(state_text))
-
-        # Add a synthetic ModelOutputThunk so LLM-as-judge requirements
-        # can use ctx.last_output() to get the "output" to judge
+        # Add a synthetic ModelOutputThunk after the state CBlock so
+        # LLM-as-judge requirements can use ctx.last_output() to get the
+        # "output" to judge
         thunk = ModelOutputThunk(state_text)
         thunk._computed = True
-        ctx = ctx.add(thunk)
 
-        return ctx
+        return cls().extend([CBlock(state_text), thunk])
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import subprocess
 from pathlib import Path
 
@@ -13,37 +14,61 @@ class Environment:
     def __init__(self, root: Path) -> None:
         self.root = root.resolve()
         self._rhizome_dir = self.root / self.RHIZOME_DIR
+        self._version = 0  # bumped whenever tracked files may have changed
+        self._committed_version = 0  # _version as of the last commit
+        self._list_files_cache: tuple[int, list[str]] | None = None
         self._ensure_git()
         self._rhizome_dir.mkdir(parents=True, exist_ok=True)
 
     def _ensure_git(self) -> None:
         if not (self.root / ".git").exists():
-            self._git("init")
-        branches = self._git("branch", "--list", self.BRANCH).strip()
-        if not branches:
-            # Create the rhizome branch from current HEAD (or orphan if empty)
-            try:
-                self._git("rev-parse", "HEAD")
-                self._git("branch", self.BRANCH)
-            except subprocess.CalledProcessError:
-                # Empty repo — create orphan branch with initial commit
-                self._git("checkout", "--orphan", self.BRANCH)
-                self._git("commit", "--allow-empty", "-m", "rhizome: init")
-                return
-        current = self._git("branch", "--show-current").strip()
-        if current != self.BRANCH:
-            self._git("checkout", self.BRANCH)
+            # Fresh repo — start directly on the rhizome branch
+            self._git("init", "-q", "-b", self.BRANCH)
+            self._git("commit", "-q", "--allow-empty", "-m", "rhizome: init")
+            return
+        current = self._run_git("symbolic-ref", "-q", "--short", "HEAD")
+        if current.stdout.strip() == self.BRANCH:
+            return
+        if self._ref_exists(f"refs/heads/{self.BRANCH}"):
+            self._git("checkout", "-q", self.BRANCH)
+        elif self._ref_exists("HEAD"):
+            # Create the rhizome branch from current HEAD
+            self._git("checkout", "-q", "-b", self.BRANCH)
+        else:
+            # Empty repo — create orphan branch with initial commit
+            self._git("checkout", "-q", "--orphan", self.BRANCH)
+            self._git("commit", "-q", "--allow-empty", "-m", "rhizome: init")
 
-    def _git(self, *args: str) -> str:
-        result = subprocess.run(
+    def _ref_exists(self, ref: str) -> bool:
+        return self._run_git("rev-parse", "--verify", "-q", ref).returncode == 0
+
+    def _run_git(self, *args: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
             ["git", *args],
             cwd=self.root,
             capture_output=True,
             text=True,
-            check=True,
+            env={**os.environ, "LC_ALL": "C"},  # stable messages for parsing
         )
+
+    def _git(self, *args: str) -> str:
+        result = self._run_git(*args)
+        if result.returncode != 0:
+            raise subprocess.CalledProcessError(
+                result.returncode, result.args, result.stdout, result.stderr
+            )
         return result.stdout
 
+    @property
+    def version(self) -> int:
+        """Counter bumped by writes, deletes, and commits."""
+        return self._version
+
+    @property
+    def has_uncommitted_changes(self) -> bool:
+        """True if files were written or deleted since the last commit."""
+        return self._version != self._committed_version
+
     def read_file(self, relpath: str) -> str | None:
         p = self.root / relpath
         if p.exists():
@@ -54,23 +79,34 @@ class Environment:
         p = self.root / relpath
         p.parent.mkdir(parents=True, exist_ok=True)
         p.write_text(content)
+        self._version += 1
 
     def delete_file(self, relpath: str) -> None:
         p = self.root / relpath
         if p.exists():
             p.unlink()
+            self._version += 1
 
     def list_files(self) -> list[str]:
-        output = self._git("ls-files")
-        return [line for line in output.strip().splitlines() if line]
+        cached = self._list_files_cache
+        if cached is None or cached[0] != self._version:
+            output = self._git("ls-files")
+            files = [line for line in output.strip().splitlines() if line]
+            cached = self._list_files_cache = (self._version, files)
+        return list(cached[1])
 
     def commit(self, message: str) -> str | None:
         self._git("add", "-A")
-        # Check if there's anything to commit
-        status = self._git("status", "--porcelain")
-        if not status.strip():
+        self._version += 1
+        # Let commit itself detect a clean index rather than probing status first
+        result = self._run_git("commit", "-q", "-m", message)
+        if result.returncode != 0 and "nothing to commit" not in result.stdout:
+            raise subprocess.CalledProcessError(
+                result.returncode, result.args, result.stdout, result.stderr
+            )
+        self._committed_version = self._version
+        if result.returncode != 0:
             return None
-        self._git("commit", "-m", message)
         return self._git("rev-parse", "HEAD").strip()
 
     def diff(self) -> str:
@@ -81,4 +117,4 @@ class Environment:
 
     @property
     def compost_path(self) -> Path:
-        return self._rhizome_dir / "compost.json"
+        return self._rhizome_dir / "compost.jsonl"
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 from mellea.core.backend import Backend
+from mellea.core.requirement import Requirement, ValidationResult
 
-from rhizome.agent import AgentHandle, AgentStatus
+from rhizome.agent import AgentHandle, AgentStatus, StateRequirement
 from rhizome.context_views import GardenerView
 
 if TYPE_CHECKING:
@@ -19,34 +21,97 @@ class Gardener:
     when the agent was registered with those needs.
     """
 
-    def __init__(self, backend: Backend) -> None:
+    def __init__(self, backend: Backend, concurrency: int = 4) -> None:
         self.backend = backend
+        self.concurrency = concurrency
 
     async def evaluate(self, rhizome: Rhizome) -> list[AgentHandle]:
-        """Check all dormant agents. Returns handles that were activated (DORMANT → PENDING)."""
+        """Check all dormant agents. Returns handles that were activated (DORMANT → PENDING).
+
+        Needs are validated concurrently across all dormant agents, bounded
+        by ``concurrency``.
+        """
         gardener_view = GardenerView.from_rhizome(rhizome)
-        activated: list[AgentHandle] = []
+        sem = asyncio.Semaphore(self.concurrency)
+        # The view is fixed for this pass, so a requirement shared by several
+        # agents only needs validating once.
+        checks: dict[int, asyncio.Future[ValidationResult]] = {}
+        # Agents still waiting on each check, by handle id
+        waiters: dict[int, dict[str, AgentHandle]] = {}
+        unmet: set[str] = set()
 
-        dormant = [
-            h for h in rhizome.handles if h.status == AgentStatus.DORMANT
-        ]
+        def abandon(handle: AgentHandle) -> None:
+            """Stop ``handle`` waiting on its needs; cancel checks no one else needs."""
+            unmet.add(handle.handle_id)
+            for req in handle.agent.needs:
+                waiting = waiters[id(req)]
+                waiting.pop(handle.handle_id, None)
+                fut = checks[id(req)]
+                if not waiting and fut is not asyncio.current_task():
+                    fut.cancel()
 
-        for handle in dormant:
-            if not handle.agent.needs:
-                # No preconditions — activate immediately
-                handle.transition(AgentStatus.PENDING)
-                activated.append(handle)
-                continue
+        async def validate(req: Requirement) -> ValidationResult:
+            async with sem:
+                return await req.validate(self.backend, gardener_view)
+
+        async def check(req: Requirement) -> ValidationResult:
+            if isinstance(req, StateRequirement):
+                # Reuse an earlier beat's result if its deps haven't moved
+                result = await rhizome._validate_state_requirement(
+                    req, lambda: validate(req)
+                )
+            else:
+                result = await validate(req)
+            if not result:
+                # Runs before the semaphore's next waiter wakes, so checks
+                # only these agents needed are cancelled before they start.
+                for handle in list(waiters[id(req)].values()):
+                    abandon(handle)
+            return result
 
-            all_satisfied = True
+        async def needs_met(handle: AgentHandle) -> bool:
+            pending = {checks[id(req)] for req in handle.agent.needs}
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                if handle.handle_id in unmet:
+                    return False  # short-circuit on the first unmet need
+                for fut in done:
+                    if fut.exception() is not None:
+                        error = error or fut.exception()
+            # A need that raised only matters if every other need was met
+            if error is not None:
+                raise error
+            return True
+
+        dormant = rhizome.handles_with_status(AgentStatus.DORMANT)
+        for handle in dormant:
             for req in handle.agent.needs:
-                result = await req.validate(self.backend, gardener_view)
-                if not result:
-                    all_satisfied = False
-                    break
+                if id(req) not in checks:
+                    waiters[id(req)] = {}
+                    checks[id(req)] = asyncio.ensure_future(check(req))
+                waiters[id(req)][handle.handle_id] = handle
+
+        try:
+            satisfied = await asyncio.gather(*(needs_met(h) for h in dormant))
+        finally:
+            # Cancel checks only abandoned agents were waiting on, and retrieve
+            # errors nobody awaited so asyncio doesn't report them as lost.
+            for fut in checks.values():
+                fut.cancel()
+                fut.add_done_callback(_discard_result)
 
-            if all_satisfied:
+        activated: list[AgentHandle] = []
+        for handle, ok in zip(dormant, satisfied):
+            if ok:
                 handle.transition(AgentStatus.PENDING)
                 activated.append(handle)
 
         return activated
+
+
+def _discard_result(fut: asyncio.Future) -> None:
+    if not fut.cancelled():
+        fut.exception()
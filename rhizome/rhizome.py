@@ -2,15 +2,22 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Awaitable, Callable, TypeVar
 
 from mellea.core.backend import Backend
+from mellea.core.base import Context
+from mellea.core.requirement import ValidationResult
 
-from rhizome.agent import Agent, AgentHandle
+from rhizome.agent import Agent, AgentHandle, AgentStatus, StateRequirement
 from rhizome.beat import BeatRecord, run_beat
 from rhizome.compost import CompostPile
 from rhizome.environment import Environment
 from rhizome.human import HumanInput
 
+_V = TypeVar("_V", bound=Context)
+
+_INTERRUPTIBLE = frozenset((AgentStatus.PENDING, AgentStatus.RUNNING))
+
 
 @dataclass
 class RhizomeConfig:
@@ -31,34 +38,113 @@ class Rhizome:
         self.environment = Environment(config.root)
         self.compost = CompostPile()
         self.handles: list[AgentHandle] = []
+        # Registered handles bucketed by status, kept in step by _on_transition
+        self._by_status: dict[AgentStatus, dict[str, AgentHandle]] = {
+            status: {} for status in AgentStatus
+        }
         self.humanity: list[HumanInput] = []
         self.beat_count: int = 0
         self._human_input_cursor: int = 0  # tracks processed human inputs
+        self._state_version: int = 0  # bumped on agent and humanity changes
+        self._view_cache: dict[type, tuple[tuple[int, int, int], Context]] = {}
+        # Non-background handles a human interrupt would kill (PENDING/RUNNING)
+        self._interruptible_count: int = 0
+        # StateRequirement results: id(req) → (req, dep versions, result)
+        self._requirement_cache: dict[
+            int, tuple[StateRequirement, tuple[int, ...], ValidationResult]
+        ] = {}
 
     async def initialize(self) -> None:
         """Load persisted state if it exists."""
         self.compost = await CompostPile.load(self.environment.compost_path)
+        self._requirement_cache.clear()
+        self._invalidate_views()
 
     def register(self, agent: Agent) -> AgentHandle:
         """Register an agent and return its handle."""
-        handle = AgentHandle(agent=agent)
+        handle = AgentHandle(agent=agent, _rhizome=self)
         self.handles.append(handle)
+        self._by_status[handle.status][handle.handle_id] = handle
+        self._invalidate_views()
         return handle
 
     def human_input(self, content: str) -> HumanInput:
         """Record human input. This will trigger interrupt on next beat."""
         inp = HumanInput(content=content)
         self.humanity.append(inp)
+        self._invalidate_views()
         return inp
 
+    def handles_with_status(self, *statuses: AgentStatus) -> list[AgentHandle]:
+        """Registered handles currently in any of ``statuses``."""
+        if len(statuses) == 1:
+            return list(self._by_status[statuses[0]].values())
+        return [h for s in statuses for h in self._by_status[s].values()]
+
+    def count_with_status(self, *statuses: AgentStatus) -> int:
+        """Number of registered handles currently in any of ``statuses``."""
+        return sum(len(self._by_status[s]) for s in statuses)
+
     def has_unprocessed_human_input(self) -> bool:
         """Check if there's human input since the last beat."""
         return self._human_input_cursor < len(self.humanity)
 
+    def has_interruptible_handles(self) -> bool:
+        """Check if a human interrupt would kill any PENDING or RUNNING handle."""
+        return self._interruptible_count > 0
+
     def mark_human_input_processed(self) -> None:
         """Mark all current human input as processed."""
         self._human_input_cursor = len(self.humanity)
 
+    def _on_transition(self, handle: AgentHandle, old_status: AgentStatus) -> None:
+        """Keep derived bookkeeping in step with a handle's status change."""
+        del self._by_status[old_status][handle.handle_id]
+        self._by_status[handle.status][handle.handle_id] = handle
+        if not handle.agent.background:
+            self._interruptible_count += (handle.status in _INTERRUPTIBLE) - (
+                old_status in _INTERRUPTIBLE
+            )
+        self._invalidate_views()
+
+    def _invalidate_views(self) -> None:
+        """Note a change to agents or humanity."""
+        self._state_version += 1
+
+    def _dep_version(self, dep: str) -> int:
+        """Current version of one ``StateRequirement.STATE_DEPS`` slice."""
+        if dep == "humanity":
+            return len(self.humanity)
+        if dep == "compost":
+            return self.compost.version
+        if dep == "environment":
+            return self.environment.version
+        return self._state_version  # "agents"; also moves on human input
+
+    async def _validate_state_requirement(
+        self,
+        req: StateRequirement,
+        validate: Callable[[], Awaitable[ValidationResult]],
+    ) -> ValidationResult:
+        """Run ``validate`` unless the deps of ``req`` are unchanged since last run."""
+        versions = tuple(self._dep_version(d) for d in req.deps)
+        cached = self._requirement_cache.get(id(req))
+        if cached is not None and cached[1] == versions:
+            return cached[2]
+        result = await validate()
+        self._requirement_cache[id(req)] = (req, versions, result)
+        return result
+
+    def _cached_view(self, view_cls: type[_V], build: Callable[[Rhizome], _V]) -> _V:
+        """Return the cached ``view_cls`` view, rebuilding it if state changed."""
+        key = (self._state_version, self.compost.version, self.environment.version)
+        cached = self._view_cache.get(view_cls)
+        if cached is not None and cached[0] == key:
+            return cached[1]  # type: ignore[return-value]
+        view = build(self)
+        self._view_cache[view_cls] = (key, view)
+        return view
+
     async def beat(self) -> BeatRecord:
         """Run one beat of the rhizome."""
         return await run_beat(self, concurrency=self.config.concurrency)
@@ -0,0 +1,12 @@
+import pytest
+
+from rhizome import Rhizome, RhizomeConfig
+
+
+@pytest.fixture
+def rhizome(tmp_path, monkeypatch):
+    # Environment commits on init; don't depend on the host's git identity
+    for var in ("GIT_AUTHOR", "GIT_COMMITTER"):
+        monkeypatch.setenv(f"{var}_NAME", "rhizome-tests")
+        monkeypatch.setenv(f"{var}_EMAIL", "rhizome-tests@example.com")
+    return Rhizome(RhizomeConfig(root=tmp_path), backend=None)
@@ -0,0 +1,63 @@
+import asyncio
+import json
+from datetime import datetime
+
+from rhizome.compost import CompostEntry, CompostPile
+
+
+def _keys(pile: CompostPile) -> list[str]:
+    return [e.key for e in pile.all_entries()]
+
+
+def test_save_load_keeps_order_of_entries_touched_between_saves(tmp_path):
+    async def run() -> None:
+        path = tmp_path / "compost.jsonl"
+        pile = CompostPile()
+        await pile.add(CompostEntry(key="S", content="s", author="t"))
+        await pile.save(path)
+        await pile.add(CompostEntry(key="A", content="a", author="t"))
+        await pile.add(CompostEntry(key="B", content="b", author="t"))
+        await pile.update("A", "a2")
+        await pile.save(path)  # appended, not compacted
+        assert _keys(pile) == ["S", "B", "A"]
+        assert _keys(await CompostPile.load(path)) == ["S", "B", "A"]
+
+        await pile.add(CompostEntry(key="C", content="c", author="t"))
+        await pile.add(CompostEntry(key="B", content="b2", author="t", supersedes="B"))
+        await pile.save(path)
+        loaded = await CompostPile.load(path)
+        assert _keys(loaded) == _keys(pile) == ["S", "A", "C", "B"]
+        assert loaded.get("B").content == "b2"
+
+    asyncio.run(run())
+
+
+def test_load_migrates_legacy_json_in_timestamp_order(tmp_path):
+    async def run() -> None:
+        # The pre-JSONL array kept an updated key at its original position
+        def legacy(key: str, content: str, ts: str) -> dict:
+            return CompostEntry(
+                key=key,
+                content=content,
+                author="t",
+                timestamp=datetime.fromisoformat(ts),
+            ).to_dict()
+
+        (tmp_path / "compost.json").write_text(
+            json.dumps(
+                [
+                    legacy("A", "a2", "2025-01-01T00:00:03+00:00"),
+                    legacy("B", "b", "2025-01-01T00:00:02+00:00"),
+                ]
+            )
+        )
+        path = tmp_path / "compost.jsonl"
+        pile = await CompostPile.load(path)
+        assert _keys(pile) == ["B", "A"]
+        assert [e.key for e in pile.recent(10)] == ["B", "A"]
+
+        await pile.save(path)
+        assert not (tmp_path / "compost.json").exists()
+        assert _keys(await CompostPile.load(path)) == ["B", "A"]
+
+    asyncio.run(run())
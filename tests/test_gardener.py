@@ -0,0 +1,78 @@
+import asyncio
+
+from mellea.core.requirement import Requirement, ValidationResult
+
+from rhizome import Agent, AgentStatus, Gardener
+
+
+class _Need(Requirement):
+    """Records each validation in ``calls``; raises if ``ok`` is None."""
+
+    def __init__(self, name: str, ok: bool | None, calls: list[str]) -> None:
+        super().__init__(name)
+        self.ok = ok
+        self.calls = calls
+
+    async def validate(self, backend, ctx, **kwargs) -> ValidationResult:
+        self.calls.append(self.description)
+        await asyncio.sleep(0)  # stand-in for a backend round trip
+        if self.ok is None:
+            raise RuntimeError(f"{self.description} failed")
+        return ValidationResult(self.ok)
+
+
+async def _noop(rhizome, backend, ctx) -> None:
+    pass
+
+
+def _evaluate(rhizome, concurrency: int = 4):
+    gardener = Gardener(backend=None, concurrency=concurrency)
+    return asyncio.run(gardener.evaluate(rhizome))
+
+
+def test_unmet_need_cancels_checks_only_that_agent_needed(rhizome):
+    calls: list[str] = []
+    a = rhizome.register(
+        Agent(
+            "a",
+            (
+                _Need("fail_fast", False, calls),
+                _Need("a_llm1", True, calls),
+                _Need("a_llm2", True, calls),
+            ),
+            _noop,
+            (),
+        )
+    )
+    b = rhizome.register(Agent("b", (_Need("b_llm", True, calls),), _noop, ()))
+
+    assert _evaluate(rhizome, concurrency=1) == [b]
+    assert calls == ["fail_fast", "b_llm"]
+    assert a.status is AgentStatus.DORMANT
+
+
+def test_unmet_need_keeps_checks_another_agent_needs(rhizome):
+    calls: list[str] = []
+    shared = _Need("shared", True, calls)
+    rhizome.register(Agent("a", (_Need("fail_fast", False, calls), shared), _noop, ()))
+    b = rhizome.register(Agent("b", (shared,), _noop, ()))
+
+    assert _evaluate(rhizome, concurrency=1) == [b]
+    assert calls == ["fail_fast", "shared"]
+
+
+def test_unmet_need_wins_over_sibling_that_raised(rhizome):
+    calls: list[str] = []
+
+    class _Slow(_Need):
+        async def validate(self, backend, ctx, **kwargs) -> ValidationResult:
+            await asyncio.sleep(0.01)
+            return await super().validate(backend, ctx, **kwargs)
+
+    rhizome.register(
+        Agent(
+            "a", (_Slow("slow", False, calls), _Need("boom", None, calls)), _noop, ()
+        )
+    )
+
+    assert _evaluate(rhizome) == []
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+from mellea.core.requirement import ValidationResult
+
+from rhizome import Agent, Gardener, StateRequirement
+
+
+async def _noop(rhizome, backend, ctx) -> None:
+    pass
+
+
+@pytest.fixture
+def env_requirement(rhizome):
+    """A never-met StateRequirement on the environment, counting validations."""
+    calls: list[int] = []
+
+    def no_readme(ctx) -> ValidationResult:
+        calls.append(1)
+        return ValidationResult(False)
+
+    req = StateRequirement(validation_fn=no_readme, deps=("environment",))
+    rhizome.register(Agent("writer", (req,), _noop, ()))
+    return calls
+
+
+def _evaluate(rhizome) -> None:
+    asyncio.run(Gardener(backend=None).evaluate(rhizome))
+
+
+def test_result_reused_while_deps_unchanged(rhizome, env_requirement):
+    _evaluate(rhizome)
+    _evaluate(rhizome)
+    rhizome.human_input("not a declared dep")
+    _evaluate(rhizome)
+    assert len(env_requirement) == 1
+
+
+def test_revalidated_after_write_and_commit(rhizome, env_requirement):
+    _evaluate(rhizome)
+    rhizome.environment.write_file("README.md", "hello")
+    _evaluate(rhizome)
+    assert len(env_requirement) == 2
+
+    rhizome.environment.commit("add readme")
+    _evaluate(rhizome)
+    _evaluate(rhizome)
+    assert len(env_requirement) == 3
+
+
+def test_unknown_dep_rejected():
+    with pytest.raises(ValueError, match="Unknown requirement deps"):
+        StateRequirement(
+            validation_fn=lambda ctx: ValidationResult(True), deps=("nope",)
+        )